@@ -15,58 +15,68 @@ import os
 # processing and should be ignored
 QSTRING_BLACK_LIST = set(['NULL', 'number_of'])
 
+# Match either a gcc-like (# n "file") or msvc-like (#line n "file") line
+# marker, capturing the filename, or a qstr token.  Line markers are matched
+# by their preceding newline rather than with ^ and re.MULTILINE, so that the
+# regex engine can quickly skip to the next '\n' or 'M' character.
+RE_MATCH = re.compile(r'\n#(?:line)?\s+\d+\s"([^"]+)"|MP_QSTR_[_a-zA-Z0-9]+')
+
 
 def write_out(fname, output):
     if output:
         for m, r in [("/", "__"), ("\\", "__"), (":", "@"), ("..", "@@")]:
             fname = fname.replace(m, r)
         with open(args.output_dir + "/" + fname + ".qstr", "w") as f:
-            f.write("\n".join(output) + "\n")
+            f.writelines(output)
 
 def process_file(f):
-    re_line = re.compile(r"#[line]*\s\d+\s\"([^\"]+)\"")
-    re_qstr = re.compile(r'MP_QSTR_[_a-zA-Z0-9]+')
     output = []
+    # qstrs already output for the current source file, seeded with the
+    # blacklist so those are never output
+    seen = set(QSTRING_BLACK_LIST)
     last_fname = None
-    for line in f:
-        if line.isspace():
+    # scan the whole preprocessor output in one pass of the regex engine,
+    # with a leading newline so a line marker on the first line is matched
+    for m in RE_MATCH.finditer("\n" + f.read()):
+        fname = m.group(1)
+        if fname is None:
+            # a qstr token, strip the MP_QSTR_ prefix
+            name = m.group()[8:]
+            if name not in seen:
+                seen.add(name)
+                output.append('Q(' + name + ')\n')
             continue
-        # match gcc-like output (# n "file") and msvc-like output (#line n "file")
-        if line.startswith(('# ', '#line')):
-            m = re_line.match(line)
-            assert m is not None
-            fname = m.group(1)
-            if not fname.endswith(".c"):
-                continue
-            if fname != last_fname:
-                write_out(last_fname, output)
-                output = []
-                last_fname = fname
+        # a line marker
+        if not fname.endswith(".c"):
             continue
-        for match in re_qstr.findall(line):
-            name = match.replace('MP_QSTR_', '')
-            if name not in QSTRING_BLACK_LIST:
-                output.append('Q(' + name + ')')
+        if fname != last_fname:
+            write_out(last_fname, output)
+            output = []
+            seen = set(QSTRING_BLACK_LIST)
+            last_fname = fname
 
     write_out(last_fname, output)
     return ""
 
 
 def cat_together():
-    import glob
     import hashlib
     hasher = hashlib.md5()
-    all_lines = []
-    outf = open(args.output_dir + "/out", "wb")
-    for fname in glob.glob(args.output_dir + "/*.qstr"):
-        with open(fname, "rb") as f:
-            lines = f.readlines()
-            all_lines += lines
-    all_lines.sort()
-    all_lines = b"\n".join(all_lines)
-    outf.write(all_lines)
-    outf.close()
-    hasher.update(all_lines)
+    # the same qstr is used by many source files, so collect the lines into a
+    # set to drop duplicates before sorting (makeqstrdata.py ignores them anyway)
+    all_lines = set()
+    # a plain directory listing is cheaper than glob's pattern matching
+    for fname in os.listdir(args.output_dir):
+        if not fname.endswith(".qstr"):
+            continue
+        with open(args.output_dir + "/" + fname, "rb") as f:
+            all_lines.update(f.readlines())
+    # lines keep their newline, so write and hash them as they are instead of
+    # joining them into one buffer first
+    with open(args.output_dir + "/out", "wb") as outf:
+        for line in sorted(all_lines):
+            outf.write(line)
+            hasher.update(line)
     new_hash = hasher.hexdigest()
     #print(new_hash)
     old_hash = None
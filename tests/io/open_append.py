@@ -9,29 +9,29 @@ if not hasattr(os, "remove"):
 
 # cleanup in case testfile exists
 try:
-    os.remove("testfile")
+    os.remove("testfile_append")
 except OSError:
     pass
 
 # Should create a file
-f = open("testfile", "a")
+f = open("testfile_append", "a")
 f.write("foo")
 f.close()
 
-f = open("testfile")
+f = open("testfile_append")
 print(f.read())
 f.close()
 
-f = open("testfile", "a")
+f = open("testfile_append", "a")
 f.write("bar")
 f.close()
 
-f = open("testfile")
+f = open("testfile_append")
 print(f.read())
 f.close()
 
 # cleanup
 try:
-    os.remove("testfile")
+    os.remove("testfile_append")
 except OSError:
     pass
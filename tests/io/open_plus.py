@@ -9,32 +9,32 @@ if not hasattr(os, "remove"):
 
 # cleanup in case testfile exists
 try:
-    os.remove("testfile")
+    os.remove("testfile_plus")
 except OSError:
     pass
 
 try:
-    f = open("testfile", "r+b")
+    f = open("testfile_plus", "r+b")
     print("Unexpectedly opened non-existing file")
 except OSError:
     print("Expected OSError")
     pass
 
-f = open("testfile", "w+b")
+f = open("testfile_plus", "w+b")
 f.write(b"1234567890")
 f.seek(0)
 print(f.read())
 f.close()
 
 # Open with truncation
-f = open("testfile", "w+b")
+f = open("testfile_plus", "w+b")
 f.write(b"abcdefg")
 f.seek(0)
 print(f.read())
 f.close()
 
 # Open without truncation
-f = open("testfile", "r+b")
+f = open("testfile_plus", "r+b")
 f.write(b"1234")
 f.seek(0)
 print(f.read())
@@ -42,6 +42,6 @@ f.close()
 
 # cleanup
 try:
-    os.remove("testfile")
+    os.remove("testfile_plus")
 except OSError:
     pass
@@ -226,6 +226,8 @@ class ProcessPtyToTerminal:
 
 class Pyboard:
     def __init__(self, device, baudrate=115200, user='micro', password='python', wait=0):
+        # data received past the ending of a read_until, to be returned by the next read
+        self.read_buf = b''
         if device.startswith("exec:"):
             self.serial = ProcessToSerial(device[len("exec:"):])
         elif device.startswith("execpty:"):
@@ -259,17 +261,45 @@ class Pyboard:
     def close(self):
         self.serial.close()
 
+    def read(self, size):
+        # return buffered data first, then read the rest from the device
+        data = self.read_buf[:size]
+        self.read_buf = self.read_buf[size:]
+        if len(data) < size:
+            data += self.serial.read(size - len(data))
+        return data
+
     def read_until(self, min_num_bytes, ending, timeout=10, data_consumer=None):
-        data = self.serial.read(min_num_bytes)
+        # bind the serial methods to locals, this loop runs once per chunk received
+        serial_read = self.serial.read
+        serial_in_waiting = self.serial.inWaiting
+        data = self.read(min_num_bytes)
         if data_consumer:
             data_consumer(data)
+        # accumulate in place, concatenating bytes would copy everything received so far
+        data = bytearray(data)
         timeout_count = 0
         while True:
             if data.endswith(ending):
                 break
-            elif self.serial.inWaiting() > 0:
-                new_data = self.serial.read(1)
-                data = data + new_data
+            if self.read_buf:
+                new_data = self.read_buf
+                self.read_buf = b''
+            else:
+                n = serial_in_waiting()
+                new_data = serial_read(n) if n > 0 else b''
+            if new_data:
+                # search for ending only where it could not have been found before,
+                # allowing for it to start in the previously received data
+                start = max(0, len(data) - len(ending) + 1)
+                data.extend(new_data)
+                i = data.find(ending, start)
+                if i >= 0:
+                    # keep anything received after ending for the next read
+                    end = i + len(ending)
+                    self.read_buf = bytes(data[end:])
+                    new_data = new_data[:len(new_data) - len(self.read_buf)]
+                    del data[end:]
                 if data_consumer:
                     data_consumer(new_data)
                 timeout_count = 0
@@ -278,12 +308,13 @@ class Pyboard:
                 if timeout is not None and timeout_count >= 100 * timeout:
                     break
                 time.sleep(0.01)
-        return data
+        return bytes(data)
 
     def enter_raw_repl(self):
         self.serial.write(b'\r\x03\x03') # ctrl-C twice: interrupt any running program
 
         # flush input (without relying on serial.flushInput())
+        self.read_buf = b''
         n = self.serial.inWaiting()
         while n > 0:
             self.serial.read(n)
@@ -344,7 +375,7 @@ class Pyboard:
         self.serial.write(b'\x04')
 
         # check if we could exec command
-        data = self.serial.read(2)
+        data = self.read(2)
         if data != b'OK':
             raise PyboardError('could not exec command (response: %r)' % data)
 